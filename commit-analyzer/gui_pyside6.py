@@ -15,35 +15,62 @@ Notes:
 - The GUI ensures end_date includes today's commits (it shifts end_date +1 day before calling cvs log).
 """
 
-import subprocess
+import importlib.util
 import sys
-import os
-import webbrowser
-from datetime import datetime, timedelta
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, QUrl, QMutex, QMutexLocker, Signal, Slot,
+    QAbstractItemModel, QModelIndex
+)
+from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QLabel, QFileDialog, QTreeWidget, QTreeWidgetItem,
-    QTextEdit, QSpinBox, QMessageBox, QProgressBar, QCheckBox, QComboBox
+    QPushButton, QLineEdit, QLabel, QFileDialog, QTreeView,
+    QTextEdit, QPlainTextEdit, QSpinBox, QMessageBox, QProgressBar, QCheckBox, QComboBox
 )
 
-# Attempt to import your analyzer module
-try:
-    from cvs_analyzer import CVSLogParser  # expects the analyzer file to be next to this GUI
-except Exception as e:
-    CVSLogParser = None
-    IMPORT_ERROR = e
-else:
-    IMPORT_ERROR = None
+# The analyzer pulls in pandas, so it is only imported when a run starts;
+# at startup we just check that it and its hard dependencies can be found.
+# (expects the analyzer file to be next to this GUI)
+_ANALYZER_MODULES = ("cvs_analyzer", "numpy", "pandas", "xlsxwriter")
+_missing_modules = [name for name in _ANALYZER_MODULES if importlib.util.find_spec(name) is None]
+IMPORT_ERROR = f"missing module(s): {', '.join(_missing_modules)}" if _missing_modules else None
+
+
+def load_json_backup(jsonf):
+    """Read a cvs_analysis_backup.json file back into groups with datetime objects."""
+    try:
+        from orjson import loads  # optional, much faster on large backups
+    except ImportError:
+        from json import loads
+    groups = loads(Path(jsonf).read_bytes())
+    # Convert back to groups with datetime objects. The parsed data is not
+    # shared with anything else, so it is updated in place.
+    fromisoformat = datetime.fromisoformat
+    for g in groups:
+        # parse start_time/end_time
+        try:
+            g['start_time'] = fromisoformat(g['start_time'])
+            g['end_time'] = fromisoformat(g['end_time'])
+        except Exception:
+            pass
+        # parse entry dates
+        for e in g.get('entries', []):
+            try:
+                e['date'] = fromisoformat(e['date'])
+            except Exception:
+                pass
+    return groups
 
 
-class AnalyzerThread(QThread):
+class AnalyzerSignals(QObject):
     """
-    Runs the analysis in background to keep UI responsive.
-    Emits:
+    Signals emitted by AnalyzerRunnable (a QRunnable cannot emit signals itself):
       finished_signal(groups:list, outdir:str)
       error_signal(message:str)
       log_signal(message:str)
@@ -56,9 +83,21 @@ class AnalyzerThread(QThread):
     started_signal = Signal()
     canceled_signal = Signal()
 
+
+class AnalyzerRunnable(QRunnable):
+    """
+    Runs the analysis on the global thread pool to keep UI responsive.
+    Exactly one of finished/error/canceled is emitted through self.signals;
+    canceled comes from request_cancel() on the caller's thread, and the
+    worker emits nothing after that, as the window may already be gone.
+    """
+
     def __init__(self, module_path: str, start_date: str, end_date: str,
                  author: Optional[str], window: int, output_filename: str):
         super().__init__()
+        # The window keeps a reference while the job runs
+        self.setAutoDelete(False)
+        self.signals = AnalyzerSignals()
         self.module_path = module_path
         self.start_date = start_date
         self.end_date = end_date
@@ -66,37 +105,59 @@ class AnalyzerThread(QThread):
         self.window = window
         self.output_filename = output_filename
         self._cancel_requested = False
+        self._proc = None
+        self._proc_lock = QMutex()
+
+    def _set_proc(self, proc):
+        # Called from the worker thread once the analyzer has started cvs log
+        with QMutexLocker(self._proc_lock):
+            self._proc = proc
+            if self._cancel_requested:
+                proc.terminate()
+
+    def _emit(self, signal, *args):
+        if not self._cancel_requested:
+            signal.emit(*args)
 
     def request_cancel(self):
-        self._cancel_requested = True
+        with QMutexLocker(self._proc_lock):
+            if self._cancel_requested:
+                return
+            self._cancel_requested = True
+            proc = self._proc
+        self.signals.canceled_signal.emit()
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        # Force it if cvs ignores the terminate request
+        QTimer.singleShot(5000, lambda: proc.poll() is None and proc.kill())
 
     def run(self):
-        if CVSLogParser is None:
-            self.error_signal.emit(f"cvs_analyzer import failed: {IMPORT_ERROR}")
+        try:
+            from cvs_analyzer import CVSLogParser
+        except Exception as e:
+            self._emit(self.signals.error_signal, f"cvs_analyzer import failed: {e}")
             return
 
         try:
-            self.started_signal.emit()
-            self.log_signal.emit(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting analyzer...")
+            self._emit(self.signals.started_signal)
+            self._emit(self.signals.log_signal, f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting analyzer...")
 
-            analyzer = CVSLogParser(module_path=self.module_path)
+            analyzer = CVSLogParser(module_path=self.module_path, process_callback=self._set_proc)
 
             # Make sure end_date includes the whole day: add +1 day
             try:
-                end_dt = datetime.strptime(self.end_date, '%Y-%m-%d')
-                end_dt_plus = end_dt + timedelta(days=1)
-                end_str = end_dt_plus.strftime('%Y-%m-%d')
+                end_str = (date.fromisoformat(self.end_date) + timedelta(days=1)).isoformat()
             except Exception:
                 # fallback: pass through
                 end_str = self.end_date
 
             # The analyzer does not provide progress callbacks; we log major steps.
-            self.log_signal.emit("Running CVS log & parsing (this may take a while for large repos)...")
+            self._emit(self.signals.log_signal, "Running CVS log & parsing (this may take a while for large repos)...")
 
             # Call analyze_repository. This will run CVS commands and create output files.
-            # We can't cancel subprocess easily here; but we respect pre-cancel request.
+            # A cancel while cvs log runs terminates the process and the analyzer stops there.
             if self._cancel_requested:
-                self.canceled_signal.emit()
                 return
 
             analyzer.analyze_repository(
@@ -108,20 +169,151 @@ class AnalyzerThread(QThread):
             )
 
             if self._cancel_requested:
-                self.canceled_signal.emit()
                 return
 
             groups = getattr(analyzer, 'grouped_commits', [])
             out_dir = str(getattr(analyzer, 'output_dir', '') or '')
-            self.log_signal.emit("Analysis finished.")
-            self.finished_signal.emit(groups, out_dir)
+            # Release the analyzer and its parsed log DataFrame before the groups are handed over
+            del analyzer
+            self._emit(self.signals.log_signal, "Analysis finished.")
+            self._emit(self.signals.finished_signal, groups, out_dir)
         except Exception as exc:
             import traceback
             tb = traceback.format_exc()
-            self.error_signal.emit(f"{str(exc)}\n\n{tb}")
+            self._emit(self.signals.error_signal, f"{str(exc)}\n\n{tb}")
+
+
+class JsonLoaderThread(QThread):
+    """
+    Loads a JSON backup in background so large backups don't freeze the UI.
+    Emits:
+      loaded(groups:list)
+      error(message:str)
+    """
+    loaded = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, jsonf: Path, mtime: float):
+        super().__init__()
+        self.jsonf = jsonf
+        self.mtime = mtime
+
+    def run(self):
+        try:
+            groups = load_json_backup(self.jsonf)
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        self.loaded.emit(groups)
+
+
+class CommitGroupsModel(QAbstractItemModel):
+    """
+    Read-only two-level model over the analyzer's commit groups:
+    one row per group, with one child row per file revision.
+
+    Row text is built on demand in data(), so only rows the view actually
+    shows are ever formatted; nothing is copied out of the groups list.
+    Group rows use internalId 0, file rows use (group row + 1).
+
+    Groups are exposed to the view in batches via load_more(), so a large
+    result can be shown a slice at a time.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups = []
+        self._headers = {}
+        self._loaded = 0
+
+    def set_groups(self, groups):
+        self.beginResetModel()
+        self._groups = groups or []
+        self._headers = {}
+        self._loaded = 0
+        self.endResetModel()
+
+    def has_more(self):
+        return self._loaded < len(self._groups)
+
+    def remaining(self):
+        return len(self._groups) - self._loaded
+
+    def load_more(self, count):
+        """Expose up to count more groups; returns the (start, end) rows added."""
+        start = self._loaded
+        end = min(start + count, len(self._groups))
+        if end > start:
+            self.beginInsertRows(QModelIndex(), start, end - 1)
+            self._loaded = end
+            self.endInsertRows()
+        return start, end
+
+    def _group_header(self, row):
+        header = self._headers.get(row)
+        if header is None:
+            g = self._groups[row]
+            # start_time in groups is a datetime object
+            st = g.get('start_time')
+            if isinstance(st, datetime):
+                st_str = st.strftime('%Y-%m-%d %H:%M:%S')
+            else:
+                st_str = str(st)
+            author = g.get('author', '')
+            main_comment = g.get('common_comment')
+            if main_comment is None:
+                # Older JSON backups predate the precomputed field
+                cnts = Counter(e['comment'] for e in g.get('entries', ()) if e.get('comment'))
+                main_comment = cnts.most_common(1)[0][0] if cnts else ''
+            header = f"[{st_str}] {author}  Comment: {main_comment}"
+            self._headers[row] = header
+        return header
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self._loaded
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._groups[parent.row()].get('entries', ()))
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        group_ref = index.internalId()
+        if group_ref == 0:
+            return self._group_header(index.row())
+        e = self._groups[group_ref - 1]['entries'][index.row()]
+        fname = e.get('file', '')
+        rev = e.get('revision', '')
+        return f"-- {fname} (rev {rev})"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Commit / Files (rev)"
+        return None
 
 
 class MainWindow(QMainWindow):
+    # Groups added to the tree per event-loop pass while populating
+    POPULATE_BATCH = 500
+    # Groups shown before population pauses for "Load More"
+    PAGE_SIZE = 2000
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("CVS Commit Manager")
@@ -191,9 +383,11 @@ class MainWindow(QMainWindow):
         left_col = QVBoxLayout()
         main_row.addLayout(left_col, 2)
 
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Commit / Files (rev)"])
-        self.tree.itemSelectionChanged.connect(self.on_selection_changed)
+        self.tree_model = CommitGroupsModel(self)
+        self.tree = QTreeView()
+        self.tree.setUniformRowHeights(True)
+        self.tree.setModel(self.tree_model)
+        self.tree.selectionModel().currentChanged.connect(self.on_selection_changed)
         left_col.addWidget(self.tree)
 
         tree_btn_row = QHBoxLayout()
@@ -204,6 +398,10 @@ class MainWindow(QMainWindow):
         collapse_all_btn = QPushButton("Collapse All")
         collapse_all_btn.clicked.connect(self.tree.collapseAll)
         tree_btn_row.addWidget(collapse_all_btn)
+        self.load_more_btn = QPushButton("Load More")
+        self.load_more_btn.setEnabled(False)
+        self.load_more_btn.clicked.connect(self.on_load_more)
+        tree_btn_row.addWidget(self.load_more_btn)
         refresh_btn = QPushButton("Refresh Tree (re-open last report)")
         refresh_btn.clicked.connect(self.on_refresh_tree)
         tree_btn_row.addWidget(refresh_btn)
@@ -233,17 +431,35 @@ class MainWindow(QMainWindow):
 
         # Logger area
         right_col.addWidget(QLabel("Log / Console:"))
-        self.log_console = QTextEdit()
+        self.log_console = QPlainTextEdit()
         self.log_console.setReadOnly(True)
+        # Keep only the most recent lines so long runs don't grow the console without bound
+        self.log_console.setMaximumBlockCount(5000)
         right_col.addWidget(self.log_console, 1)
 
+        # Log lines are buffered and written to the console at most every 50 ms
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # Internal state
-        self.thread: Optional[AnalyzerThread] = None
+        self.analyzer_job: Optional[AnalyzerRunnable] = None
         self.last_outdir: Optional[str] = None
         self.last_groups = []
+        self._json_cache = None  # (path, mtime, groups) of the last parsed JSON backup
+        self.json_loader: Optional[JsonLoaderThread] = None
+
+        # Drives incremental tree population; restarting it never queues a second pass
+        self._populate_timer = QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.setInterval(0)
+        self._populate_timer.timeout.connect(self._populate_next_batch)
+        self._populate_limit = 0
 
         # If import failed, disable run
-        if CVSLogParser is None:
+        if IMPORT_ERROR is not None:
             self.run_btn.setEnabled(False)
             self.status_label.setText(f"cvs_analyzer import failed: {IMPORT_ERROR}")
 
@@ -267,10 +483,9 @@ class MainWindow(QMainWindow):
 
         # Prepare parameters
         days = int(self.days_spin.value())
-        end_dt = datetime.now()
-        start_dt = end_dt - timedelta(days=days)
-        start_str = start_dt.strftime('%Y-%m-%d')
-        end_str = end_dt.strftime('%Y-%m-%d')  # the thread will add +1 day
+        end_d = date.today()
+        start_str = (end_d - timedelta(days=days)).isoformat()
+        end_str = end_d.isoformat()  # the thread will add +1 day
 
         author = self.author_edit.text().strip() or None
         window = int(self.window_spin.value())
@@ -280,12 +495,13 @@ class MainWindow(QMainWindow):
         self.pb.setVisible(True)
         self.cancel_btn.setEnabled(True)
         self.run_btn.setEnabled(False)
+        self._log_buf.clear()
         self.log_console.clear()
-        self.tree.clear()
+        self.tree_model.set_groups([])
         self.detail_text.clear()
 
-        # Start thread
-        self.thread = AnalyzerThread(
+        # Start the analysis on the thread pool
+        self.analyzer_job = AnalyzerRunnable(
             module_path=str(p),
             start_date=start_str,
             end_date=end_str,
@@ -293,23 +509,32 @@ class MainWindow(QMainWindow):
             window=window,
             output_filename="cvs_commit_analysis.xlsx"
         )
-        self.thread.started_signal.connect(lambda: self.append_log("Worker started."))
-        self.thread.log_signal.connect(self.append_log)
-        self.thread.finished_signal.connect(self.on_analysis_finished)
-        self.thread.error_signal.connect(self.on_analysis_error)
-        self.thread.canceled_signal.connect(self.on_analysis_canceled)
-        self.thread.start()
+        signals = self.analyzer_job.signals
+        signals.started_signal.connect(lambda: self.append_log("Worker started."))
+        signals.log_signal.connect(self.append_log)
+        signals.finished_signal.connect(self.on_analysis_finished)
+        signals.error_signal.connect(self.on_analysis_error)
+        signals.canceled_signal.connect(self.on_analysis_canceled)
+        QThreadPool.globalInstance().start(self.analyzer_job)
+
+    def closeEvent(self, event):
+        # Stop a running analysis with the window; otherwise the app lingers at exit
+        # until cvs log and the exports finish, since the thread pool is waited on
+        if self.analyzer_job:
+            self.analyzer_job.request_cancel()
+        super().closeEvent(event)
 
     @Slot()
     def on_cancel(self):
-        if self.thread and self.thread.isRunning():
-            res = QMessageBox.question(self, "Cancel", "Request cancel? This attempts to stop the analysis. Subprocesses may still run.")
+        if self.analyzer_job:
+            res = QMessageBox.question(self, "Cancel", "Request cancel? This stops the running cvs log and the analysis.")
             if res == QMessageBox.Yes:
-                self.thread.request_cancel()
                 self.append_log("Cancel requested...")
+                self.analyzer_job.request_cancel()
 
     @Slot(object, str)
     def on_analysis_finished(self, groups, outdir):
+        self.analyzer_job = None
         self.last_groups = groups or []
         self.last_outdir = outdir or ''
         self.append_log("Worker finished successfully.")
@@ -325,6 +550,7 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def on_analysis_canceled(self):
+        self.analyzer_job = None
         self.append_log("Analysis canceled.")
         self.pb.setVisible(False)
         self.run_btn.setEnabled(True)
@@ -333,6 +559,7 @@ class MainWindow(QMainWindow):
 
     @Slot(str)
     def on_analysis_error(self, message):
+        self.analyzer_job = None
         self.append_log(f"ERROR: {message}")
         QMessageBox.critical(self, "Analysis error", message)
         self.pb.setVisible(False)
@@ -341,45 +568,61 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Error")
 
     def append_log(self, message: str):
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_console.append(f"[{ts}] {message}")
+        ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._log_buf.append(f"[{ts}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @Slot()
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        self.log_console.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
 
     def _populate_tree_from_groups(self, groups):
-        self.tree.clear()
+        # A model reset drops the current index without emitting currentChanged
+        self.tree_model.set_groups(groups)
+        self.detail_text.clear()
         if not groups:
+            self._populate_timer.stop()
+            self._update_load_more()
             QMessageBox.information(self, "No commits", "No commit groups found in the selected range.")
             return
+        # Add the first page in batches, letting the event loop repaint and handle input in between
+        self._populate_limit = self.PAGE_SIZE
+        self._populate_timer.start()
+        self._update_load_more()
 
-        for idx, g in enumerate(groups, 1):
-            # start_time in groups is a datetime object
-            st = g.get('start_time')
-            if isinstance(st, datetime):
-                st_str = st.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                st_str = str(st)
-            author = g.get('author', '')
-            comments = [e.get('comment', '') for e in g.get('entries', []) if e.get('comment')]
-            main_comment = max(set(comments), key=comments.count) if comments else ''
-            header = f"[{st_str}] {author}  Comment: {main_comment}"
-            top = QTreeWidgetItem([header])
-            # Add files as children
-            for e in g.get('entries', []):
-                fname = e.get('file', '')
-                rev = e.get('revision', '')
-                child_txt = f"-- {fname} (rev {rev})"
-                child = QTreeWidgetItem([child_txt])
-                top.addChild(child)
-            self.tree.addTopLevelItem(top)
-            top.setExpanded(True)
-        self.tree.expandAll()
+    @Slot()
+    def _populate_next_batch(self):
+        count = min(self.POPULATE_BATCH, self._populate_limit - self.tree_model.rowCount())
+        start, end = self.tree_model.load_more(count)
+        for row in range(start, end):
+            self.tree.expand(self.tree_model.index(row, 0))
+        if end < self._populate_limit and self.tree_model.has_more():
+            self._populate_timer.start()
+        # Keep the remaining count in step with the rows shown so far
+        self._update_load_more()
+
+    @Slot()
+    def on_load_more(self):
+        self._populate_limit = self.tree_model.rowCount() + self.PAGE_SIZE
+        self._populate_timer.start()
+        self._update_load_more()
+
+    def _update_load_more(self):
+        remaining = self.tree_model.remaining()
+        self.load_more_btn.setEnabled(remaining > 0 and not self._populate_timer.isActive())
+        self.load_more_btn.setText(f"Load More ({remaining} left)" if remaining else "Load More")
 
     @Slot()
     def on_selection_changed(self):
-        it = self.tree.currentItem()
-        if not it:
+        idx = self.tree.currentIndex()
+        if not idx.isValid():
             self.detail_text.clear()
             return
-        self.detail_text.setPlainText(it.text(0))
+        self.detail_text.setPlainText(idx.data())
 
     @Slot()
     def on_open_html(self):
@@ -390,7 +633,7 @@ class MainWindow(QMainWindow):
         if not html.exists():
             QMessageBox.information(self, "Missing file", f"HTML report not found:\n{html}")
             return
-        webbrowser.open(str(html))
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(html.resolve())))
 
     @Slot()
     def on_open_folder(self):
@@ -402,12 +645,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Missing folder", f"Output folder not found:\n{p}")
             return
         # Open in platform file explorer
-        if sys.platform.startswith("win"):
-            os.startfile(str(p))
-        elif sys.platform.startswith("darwin"):
-            subprocess.run(["open", str(p)])
-        else:
-            subprocess.run(["xdg-open", str(p)])
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(p.resolve())))
 
     @Slot()
     def on_open_excel(self):
@@ -419,12 +657,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Missing file", f"Excel file not found:\n{xlsx}")
             return
         # Launch file with default app
-        if sys.platform.startswith("win"):
-            os.startfile(str(xlsx))
-        elif sys.platform.startswith("darwin"):
-            subprocess.run(["open", str(xlsx)])
-        else:
-            subprocess.run(["xdg-open", str(xlsx)])
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(xlsx.resolve())))
 
     @Slot()
     def on_refresh_tree(self):
@@ -436,39 +669,37 @@ class MainWindow(QMainWindow):
         if not jsonf.exists():
             QMessageBox.information(self, "Missing", f"JSON backup not found:\n{jsonf}")
             return
-        try:
-            import json
-            with open(jsonf, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            # Convert back to groups with datetime objects
-            groups = []
-            for g in data:
-                ng = g.copy()
-                # parse start_time/end_time
-                try:
-                    ng['start_time'] = datetime.fromisoformat(g['start_time'])
-                except Exception:
-                    pass
-                try:
-                    ng['end_time'] = datetime.fromisoformat(g['end_time'])
-                except Exception:
-                    pass
-                # parse entry dates
-                ng_entries = []
-                for e in g.get('entries', []):
-                    ne = e.copy()
-                    try:
-                        ne['date'] = datetime.fromisoformat(e['date'])
-                    except Exception:
-                        pass
-                    ng_entries.append(ne)
-                ng['entries'] = ng_entries
-                groups.append(ng)
-            self.last_groups = groups
-            self._populate_tree_from_groups(groups)
-            self.append_log("Tree refreshed from existing JSON backup.")
-        except Exception as exc:
-            QMessageBox.critical(self, "Error", f"Failed to load JSON backup: {exc}")
+        if self.json_loader and self.json_loader.isRunning():
+            return
+        mtime = jsonf.stat().st_mtime
+        cached = self._json_cache
+        if cached and cached[0] == jsonf and cached[1] == mtime:
+            # Backup unchanged since the last refresh: reuse the parsed groups
+            self._show_json_groups(cached[2])
+            return
+        # Parse off the GUI thread; the tree is filled when the loader reports back
+        self.status_label.setText("Loading JSON backup...")
+        self.json_loader = JsonLoaderThread(jsonf, mtime)
+        self.json_loader.loaded.connect(self.on_json_loaded)
+        self.json_loader.error.connect(self.on_json_load_error)
+        self.json_loader.start()
+
+    @Slot(object)
+    def on_json_loaded(self, groups):
+        loader = self.json_loader
+        self._json_cache = (loader.jsonf, loader.mtime, groups)
+        self.status_label.setText("Ready")
+        self._show_json_groups(groups)
+
+    @Slot(str)
+    def on_json_load_error(self, message):
+        self.status_label.setText("Error")
+        QMessageBox.critical(self, "Error", f"Failed to load JSON backup: {message}")
+
+    def _show_json_groups(self, groups):
+        self.last_groups = groups
+        self._populate_tree_from_groups(groups)
+        self.append_log("Tree refreshed from existing JSON backup.")
 
 def main():
     app = QApplication(sys.argv)
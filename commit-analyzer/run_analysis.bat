@@ -33,13 +33,13 @@ if not exist "cvs_config.py" (
 
 REM Install required Python packages if needed
 echo Checking Python dependencies...
-python -c "import pandas, openpyxl" >nul 2>&1
+python -c "import pandas, xlsxwriter" >nul 2>&1
 if errorlevel 1 (
     echo Installing required packages...
-    pip install pandas openpyxl
+    pip install pandas xlsxwriter
     if errorlevel 1 (
         echo Error: Failed to install required packages
-        echo Please run: pip install pandas openpyxl
+        echo Please run: pip install pandas xlsxwriter
         pause
         exit /b 1
     )
@@ -1,73 +1,148 @@
+import queue
 import re
+import threading
 import tkinter as tk
 from tkinter import scrolledtext
 
-def extract_file_info(log_data):
+# The regular expression pattern is designed to find two specific pieces of information:
+# 1. The file path, which is located after " <-- ".
+# 2. The new revision number, which is located after "new revision: ".
+
+# Let's break down the pattern:
+# '--\s+'        - Matches the literal " <-- " (note the whitespace after the arrow).
+# '(.+?)\n'      - This is the first capturing group.
+#                - (.+?) matches any character (.) one or more times (+),
+#                  but non-greedily (?). This ensures it captures the file path
+#                  until it hits the next part of the pattern.
+#                - \n matches the newline character.
+# 'new revision:\s+' - Matches the literal "new revision: ", followed by one or more spaces.
+# '([\d.]+);'      - This is the second capturing group.
+#                - [\d.] matches any digit or a period.
+#                - + matches one or more of the preceding characters.
+#                - ; matches the literal semicolon.
+
+# We use re.DOTALL to allow the '.' in the pattern to match newline characters,
+# which is essential for processing the multi-line log string.
+# The pattern is compiled once, at import time.
+_REVISION_PATTERN = re.compile(r'--\s+(.+?)\nnew revision:\s+([\d.]+);', re.DOTALL)
+
+# The input is read and matched in windows of this many lines. Unmatched text at
+# the end of a window (up to CARRY_SIZE characters) is carried into the next one,
+# so an entry split across two windows is still found.
+LINES_PER_CHUNK = 500
+CARRY_SIZE = 4096
+# How often (in ms) the Tk loop picks up results from the extraction thread
+POLL_INTERVAL_MS = 50
+
+# Input windows travel from the Tk thread to the worker thread, and results back,
+# through these queues; None marks the end of a run. The input queue is bounded so
+# only a few windows of the log are ever held outside the widget.
+_input_queue = queue.Queue(maxsize=4)
+_results_queue = queue.Queue()
+
+def extract_file_info_chunks(chunks):
     """
-    Extracts file paths and new revision numbers from CVS log data.
+    Extracts file paths and new revision numbers from CVS log data,
+    one piece of the log at a time.
 
     Args:
-        log_data (str): The CVS log data as a single string.
+        chunks (iterable of str): Consecutive pieces of the CVS log data.
+
+    Yields:
+        For each chunk, a list of the "filepath: new_revision;" strings
+        completed in it.
+    """
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk
+        results = []
+        end = 0
+        # finditer yields one match at a time; .strip() removes any
+        # leading/trailing whitespace from the extracted file path.
+        for m in _REVISION_PATTERN.finditer(text):
+            results.append(f"{m.group(1).strip()}: {m.group(2)};")
+            end = m.end()
+        # Anything after the last match may be the start of an entry that
+        # continues in the next chunk.
+        carry = text[end:][-CARRY_SIZE:]
+        yield results
+
+def read_input_chunks():
+    """
+    Yields the contents of the input widget LINES_PER_CHUNK lines at a time,
+    instead of copying the whole buffer out in one go.
+    """
+    last_line = int(input_text_widget.index("end-1c").split(".")[0])
+    for line in range(1, last_line + 1, LINES_PER_CHUNK):
+        yield input_text_widget.get(f"{line}.0", f"{line + LINES_PER_CHUNK}.0")
+
+def feed_input_chunks(chunks):
+    """
+    Runs on the Tk thread. Hands the worker one input window per tick and
+    re-schedules itself until the input is exhausted.
+    """
+    if _input_queue.full():
+        app.after(POLL_INTERVAL_MS, feed_input_chunks, chunks)
+        return
+    chunk = next(chunks, None)
+    _input_queue.put(chunk)
+    if chunk is not None:
+        app.after(0, feed_input_chunks, chunks)
+
+def extraction_worker(chunks):
+    """
+    Runs on a background thread. Never touches Tk widgets directly; results
+    are handed to the Tk thread through _results_queue.
+    """
+    try:
+        for extracted_info in extract_file_info_chunks(chunks):
+            if extracted_info:
+                _results_queue.put(extracted_info)
+    finally:
+        _results_queue.put(None)
 
-    Returns:
-        A list of strings, where each string is in the format
-        "filepath: new_revision;".
+def deliver_results():
+    """
+    Runs on the Tk thread. Appends whatever the worker has produced so far
+    to the output widget and re-schedules itself until the worker is done.
     """
-    # The regular expression pattern is designed to find two specific pieces of information:
-    # 1. The file path, which is located after " <-- ".
-    # 2. The new revision number, which is located after "new revision: ".
-    
-    # Let's break down the pattern:
-    # '--\s+'        - Matches the literal " <-- " (note the whitespace after the arrow).
-    # '(.+?)\n'      - This is the first capturing group.
-    #                - (.+?) matches any character (.) one or more times (+),
-    #                  but non-greedily (?). This ensures it captures the file path
-    #                  until it hits the next part of the pattern.
-    #                - \n matches the newline character.
-    # 'new revision:\s+' - Matches the literal "new revision: ", followed by one or more spaces.
-    # '([\d.]+);'      - This is the second capturing group.
-    #                - [\d.] matches any digit or a period.
-    #                - + matches one or more of the preceding characters.
-    #                - ; matches the literal semicolon.
-    
-    # We use re.DOTALL to allow the '.' in the pattern to match newline characters,
-    # which is essential for processing the multi-line log string.
-    pattern = re.compile(r'--\s+(.+?)\nnew revision:\s+([\d.]+);', re.DOTALL)
-    
-    # Find all occurrences of the pattern in the log data.
-    matches = pattern.findall(log_data)
-    
-    results = []
-    for file_path, revision in matches:
-        # For each match, format the output string and add it to the results list.
-        # We also use .strip() to remove any leading/trailing whitespace from the extracted file path.
-        results.append(f"{file_path.strip()}: {revision};")
-
-    return results
+    while True:
+        try:
+            extracted_info = _results_queue.get_nowait()
+        except queue.Empty:
+            app.after(POLL_INTERVAL_MS, deliver_results)
+            return
+        if extracted_info is None:
+            break
+        # Each result goes on its own line
+        separator = "\n" if output_text_widget.compare("end-1c", "!=", "1.0") else ""
+        output_text_widget.insert(tk.END, separator + "\n".join(extracted_info))
+
+    # Disable editing for the output widget and allow the next run
+    output_text_widget.configure(state=tk.DISABLED)
+    input_text_widget.configure(state=tk.NORMAL)
+    extract_button.configure(state=tk.NORMAL)
 
 def run_extraction():
     """
     This function is called when the 'Extract' button is clicked.
-    It gets the input text, runs the extraction, and displays the output.
+    It starts the extraction on a background thread and feeds it the input
+    text window by window, so the window stays responsive while a large log
+    is processed.
     """
-    # Get the text from the input ScrolledText widget
-    log_data = input_text_widget.get("1.0", tk.END)
-    
+    # The button and the input stay disabled until this run has delivered all its results
+    extract_button.configure(state=tk.DISABLED)
+    input_text_widget.configure(state=tk.DISABLED)
+
     # Clear the previous content from the output ScrolledText widget
     output_text_widget.configure(state=tk.NORMAL)  # Enable editing
     output_text_widget.delete("1.0", tk.END)
-    
-    # Run the extraction function
-    extracted_info = extract_file_info(log_data)
-    
-    # Format the output as a single string, with each result on a new line
-    output_string = "\n".join(extracted_info)
-    
-    # Insert the new output into the widget
-    output_text_widget.insert(tk.END, output_string)
-    
-    # Disable editing for the output widget
-    output_text_widget.configure(state=tk.DISABLED)
+
+    # Tk widgets may only be read on this thread, so the windows are read here
+    # and queued for the worker as it goes
+    threading.Thread(target=extraction_worker, args=(iter(_input_queue.get, None),), daemon=True).start()
+    feed_input_chunks(read_input_chunks())
+    app.after(POLL_INTERVAL_MS, deliver_results)
 
 # Create the main application window
 app = tk.Tk()
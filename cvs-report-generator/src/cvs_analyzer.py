@@ -10,20 +10,68 @@ Usage:
 """
 
 import subprocess
-import re
+import html
 import json
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
+import threading
 from pathlib import Path
 import webbrowser
 
+try:
+    import orjson  # optional, much faster JSON backup
+except ImportError:
+    orjson = None
+
+# parse_log_output states
+_SCAN, _IN_FILE, _AFTER_REV, _IN_COMMENT = range(4)
+_REVISION_SEPARATOR = '-' * 28
+_ENTRY_COLUMNS = ('file', 'revision', 'date', 'author', 'comment', 'raw_date_str')
+_DATE_FORMATS = (
+    '%Y/%m/%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S %z',
+    '%Y/%m/%d %H:%M:%S %z'
+)
+# Date separator -> plain format, for routing dates to a bulk parse
+_PLAIN_DATE_FORMATS = {'/': _DATE_FORMATS[0], '-': _DATE_FORMATS[1]}
+
+def _utc_offset(suffix):
+    # ' +hhmm' / ' -hhmm' as appended by cvs >= 1.12
+    if len(suffix) != 6 or suffix[0] != ' ' or suffix[1] not in '+-' or not suffix[2:].isdigit():
+        return None
+    hours, minutes = int(suffix[2:4]), int(suffix[4:6])
+    # Out-of-range offsets are left to the per-row fallback, which warns and drops the row
+    if hours > 23 or minutes > 59:
+        return None
+    offset = timedelta(hours=hours, minutes=minutes)
+    return timezone(-offset if suffix[1] == '-' else offset)
+
+def _parse_cvs_date(date_str):
+    # Per-row fallback for dates the bulk parse in _entries_frame could not handle
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class CVSLogParser:
-    def __init__(self, cvs_root=None, module_path="."):
+    def __init__(self, cvs_root=None, module_path=".", process_callback=None):
         self.cvs_root = cvs_root
         self.module_path = Path(module_path).resolve()
+        # Called with the cvs log Popen once it starts, so a caller can terminate it
+        self.process_callback = process_callback
         self.log_entries = []
         self.grouped_commits = []
         self.output_dir = None
@@ -37,122 +85,178 @@ class CVSLogParser:
         if author:
             cmd.extend(["-w", author])
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.module_path, check=True)
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            print(f"Error running CVS command: {e}")
-            print(f"Error output: {e.stderr}")
-            return None
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                    cwd=self.module_path, bufsize=1 << 20)
         except FileNotFoundError:
             print("Error: CVS command not found. Make sure CVS is installed and in PATH.")
             return None
+        if self.process_callback:
+            self.process_callback(proc)
+        return proc
+
+    def _read_cvs_log(self, proc):
+        # Drain stderr on a separate thread so a chatty cvs cannot block on a full pipe
+        stderr_chunks = []
+        drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        drain.start()
+        try:
+            entries = self.parse_log_stream(proc.stdout)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+            drain.join()
+            proc.stderr.close()
+        if proc.returncode != 0:
+            print(f"Error running CVS command: {subprocess.CalledProcessError(proc.returncode, proc.args)}")
+            print(f"Error output: {''.join(stderr_chunks)}")
+            return None
+        return entries
 
     def parse_log_output(self, log_output):
         if not log_output:
-            return []
+            return self._entries_frame({name: [] for name in _ENTRY_COLUMNS})
+        return self.parse_log_stream(log_output.split('\n'))
+
+    def parse_log_stream(self, line_iter):
         print("Parsing CVS log output...")
-        entries = []
+        columns = {name: [] for name in _ENTRY_COLUMNS}
+        state = _SCAN
         current_file = None
-        rcs_sections = re.split(r'^RCS file:', log_output, flags=re.MULTILINE)
-        for section in rcs_sections[1:]:
-            lines = section.strip().split('\n')
-            if not lines:
+        revision = None
+        date_str = None
+        author = None
+        comment_lines = []
+        for line in line_iter:
+            line = line.rstrip('\r\n')
+            if line.startswith('RCS file:'):
+                if state == _IN_COMMENT:
+                    self._append_entry(columns, current_file, revision, date_str, author, comment_lines)
+                current_file = self.extract_filename(line[9:].strip())
+                state = _IN_FILE
+            elif state == _SCAN:
                 continue
-            rcs_file = lines[0].strip()
-            current_file = self.extract_filename(rcs_file)
-            revision_pattern = r'^revision (\S+)'
-            date_pattern = r'^date: ([^;]+);  author: ([^;]+);'
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-                rev_match = re.match(revision_pattern, line)
-                if rev_match:
-                    revision = rev_match.group(1)
-                    i += 1
-                    if i < len(lines):
-                        date_match = re.match(date_pattern, lines[i])
-                        if date_match:
-                            date_str = date_match.group(1).strip()
-                            author = date_match.group(2).strip()
-                            i += 1
-                            comment_lines = []
-                            while i < len(lines) and not re.match(r'^(revision|---)', lines[i]):
-                                line_text = lines[i].strip()
-                                if line_text and not re.match(r'^=+$', line_text):
-                                    comment_lines.append(line_text)
-                                i += 1
-                            comment = ' '.join(comment_lines)
-                            commit_date = None
-                            date_formats = [
-                                '%Y/%m/%d %H:%M:%S',
-                                '%Y-%m-%d %H:%M:%S',
-                                '%Y-%m-%d %H:%M:%S %z',
-                                '%Y/%m/%d %H:%M:%S %z'
-                            ]
-                            for fmt in date_formats:
-                                try:
-                                    commit_date = datetime.strptime(date_str, fmt)
-                                    break
-                                except ValueError:
-                                    continue
-                            if not commit_date:
-                                print(f"Warning: Could not parse date: {date_str}")
-                                continue
-                            entries.append({
-                                'file': current_file,
-                                'revision': revision,
-                                'date': commit_date,
-                                'author': author,
-                                'comment': comment,
-                                'raw_date_str': date_str
-                            })
-                i += 1
+            elif state == _IN_COMMENT:
+                # Only a revision separator ends a comment; the '=====' line closing a file is
+                # skipped like any other all-'=' line, and 'RCS file:' flushes the entry above
+                if line == _REVISION_SEPARATOR or line.startswith('revision '):
+                    self._append_entry(columns, current_file, revision, date_str, author, comment_lines)
+                    state = _IN_FILE
+                else:
+                    line_text = line.strip()
+                    if line_text and line_text.strip('='):
+                        comment_lines.append(line_text)
+                    continue
+            if state == _IN_FILE:
+                if line.startswith('revision '):
+                    rev_fields = line[9:].split()
+                    if rev_fields:
+                        revision = rev_fields[0]
+                        state = _AFTER_REV
+                elif line.startswith('====='):
+                    state = _SCAN
+            elif state == _AFTER_REV:
+                state = _IN_FILE
+                if line.startswith('date: '):
+                    fields = line.split(';', 2)
+                    if len(fields) > 2 and fields[1].startswith('  author: '):
+                        date_str = fields[0][6:].strip()
+                        author = sys.intern(fields[1][10:].strip())
+                        comment_lines = []
+                        state = _IN_COMMENT
+        if state == _IN_COMMENT:
+            self._append_entry(columns, current_file, revision, date_str, author, comment_lines)
+        entries = self._entries_frame(columns)
         print(f"Parsed {len(entries)} log entries")
         return entries
 
+    def _append_entry(self, columns, current_file, revision, date_str, author, comment_lines):
+        columns['file'].append(current_file)
+        columns['revision'].append(revision)
+        columns['author'].append(author)
+        columns['comment'].append(' '.join(comment_lines))
+        columns['raw_date_str'].append(date_str)
+
+    def _entries_frame(self, columns):
+        raw_dates = pd.Series(columns['raw_date_str'], dtype=object)
+        dates = np.full(len(raw_dates), None, dtype=object)
+        fallback = []
+        # Batch the dates by separator and ' +hhmm' suffix (cvs >= 1.12), parse each batch in
+        # bulk with the plain format and attach the batch's offset afterwards
+        shapes = raw_dates.groupby([raw_dates.str[4], raw_dates.str[19:]], sort=False, dropna=False)
+        for (sep, suffix), batch in shapes:
+            fmt = _PLAIN_DATE_FORMATS.get(sep)
+            tz = _utc_offset(suffix) if suffix else None
+            if fmt is None or (suffix and tz is None):
+                fallback.extend(batch.index.tolist())
+                continue
+            parsed = pd.to_datetime(batch.str[:19], format=fmt, errors='coerce', cache=True)
+            if tz is not None:
+                parsed = parsed.dt.tz_localize(tz)
+            ok = parsed.notna().to_numpy()
+            dates[batch.index[ok]] = np.asarray(parsed[ok].dt.to_pydatetime(), dtype=object)
+            fallback.extend(batch.index[~ok].tolist())
+        # Anything left over goes through the strptime ladder one row at a time
+        for i in fallback:
+            raw = columns['raw_date_str'][i]
+            dates[i] = _parse_cvs_date(raw)
+            if dates[i] is None:
+                print(f"Warning: Could not parse date: {raw}")
+        keep = pd.notna(dates)
+        # One column per field; authors repeat heavily, so store them as a categorical
+        frame = pd.DataFrame({
+            'file': columns['file'],
+            'revision': columns['revision'],
+            # Kept as the parsed datetime objects so entries hand them out directly
+            'date': pd.Series(dates, dtype=object),
+            'author': pd.Categorical(columns['author']),
+            'comment': columns['comment'],
+            'raw_date_str': columns['raw_date_str']
+        }, columns=list(_ENTRY_COLUMNS))
+        return frame[keep].reset_index(drop=True) if not keep.all() else frame
+
     def extract_filename(self, rcs_path):
-        clean_path = rcs_path.replace('/RCS/', '/')
-        if clean_path.endswith(',v'):
-            clean_path = clean_path[:-2]
+        clean_path = rcs_path[:-2] if rcs_path.endswith(',v') else rcs_path
+        if '/RCS/' in clean_path:
+            clean_path = clean_path.replace('/RCS/', '/')
         return clean_path
 
     def group_commits(self, entries, time_window_minutes=10):
         print(f"Grouping commits within {time_window_minutes} minute windows...")
-        sorted_entries = sorted(entries, key=lambda x: x['date'])
         groups = []
-        current_group = []
-        group_id = 1
-        for entry in sorted_entries:
-            if not current_group:
-                current_group = [entry]
-            else:
-                last_entry = current_group[-1]
-                time_diff = abs((entry['date'] - last_entry['date']).total_seconds() / 60)
-                if (entry['author'] == last_entry['author'] and time_diff <= time_window_minutes):
-                    current_group.append(entry)
+        if not entries.empty:
+            instants = pd.to_datetime(entries['date'], utc=True).dt.tz_convert(None).to_numpy()
+            order = np.argsort(instants, kind='stable')
+            instants = instants[order]
+            sorted_frame = entries.take(order)
+            author_codes = sorted_frame['author'].cat.codes.to_numpy()
+            # A new group starts wherever the author changes or the gap exceeds the window
+            window = pd.Timedelta(minutes=time_window_minutes).to_timedelta64()
+            breaks = (np.diff(instants) > window) | (author_codes[1:] != author_codes[:-1])
+            bounds = np.concatenate(([0], np.flatnonzero(breaks) + 1, [len(instants)])).tolist()
+            # Plain per-column lists, in date order; each group is a slice of them
+            columns = [sorted_frame[name].tolist() for name in _ENTRY_COLUMNS]
+            sorted_entries = [dict(zip(_ENTRY_COLUMNS, row)) for row in zip(*columns)]
+            dates, authors, comments = columns[2], columns[3], columns[4]
+            for group_id, (start, end) in enumerate(zip(bounds[:-1], bounds[1:]), 1):
+                if end - start == 1:
+                    common_comment = all_comments = comments[start]
                 else:
-                    if current_group:
-                        groups.append({
-                            'group_id': group_id,
-                            'entries': current_group.copy(),
-                            'start_time': min(e['date'] for e in current_group),
-                            'end_time': max(e['date'] for e in current_group),
-                            'author': current_group[0]['author'],
-                            'file_count': len(current_group),
-                            'files': [e['file'] for e in current_group]
-                        })
-                        group_id += 1
-                    current_group = [entry]
-        if current_group:
-            groups.append({
-                'group_id': group_id,
-                'entries': current_group.copy(),
-                'start_time': min(e['date'] for e in current_group),
-                'end_time': max(e['date'] for e in current_group),
-                'author': current_group[0]['author'],
-                'file_count': len(current_group),
-                'files': [e['file'] for e in current_group]
-            })
+                    group_comments = [c for c in comments[start:end] if c]
+                    common_comment = Counter(group_comments).most_common(1)[0][0] if group_comments else ""
+                    all_comments = ' | '.join(group_comments)
+                # Entries are sorted by date, so the endpoints are the min and max
+                start_time = dates[start]
+                groups.append({
+                    'group_id': group_id,
+                    'entries': sorted_entries[start:end],
+                    'start_time': start_time,
+                    'start_str': start_time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'end_time': dates[end - 1],
+                    'author': authors[start],
+                    'file_count': end - start,
+                    'common_comment': common_comment,
+                    'all_comments': all_comments
+                })
         print(f"Created {len(groups)} commit groups")
         return groups
 
@@ -164,26 +268,13 @@ class CVSLogParser:
         self.output_dir = timestamp_folder
         return timestamp_folder
 
-    def export_to_excel(self, groups, filename):
-        print(f"Exporting to Excel: {filename}")
+    def _build_frames(self, groups):
         rows = []
-        for group in groups:
-            comments = [e['comment'] for e in group['entries'] if e['comment']]
-            common_comment = max(set(comments), key=comments.count) if comments else ""
-            rows.append({
-                'Group_ID': group['group_id'],
-                'Date_Time': group['start_time'].strftime('%Y-%m-%d %H:%M:%S'),
-                'Author': group['author'],
-                'File_Count': group['file_count'],
-                'Duration_Minutes': (group['end_time'] - group['start_time']).total_seconds() / 60,
-                'Files': '; '.join(group['files']),
-                'Common_Comment': common_comment,
-                'All_Comments': ' | '.join([e['comment'] for e in group['entries'] if e['comment']])
-            })
-        df = pd.DataFrame(rows)
         detailed_rows = []
         for group in groups:
+            files = []
             for entry in group['entries']:
+                files.append(entry['file'])
                 detailed_rows.append({
                     'Group_ID': group['group_id'],
                     'File': entry['file'],
@@ -192,23 +283,28 @@ class CVSLogParser:
                     'Author': entry['author'],
                     'Comment': entry['comment']
                 })
-        detailed_df = pd.DataFrame(detailed_rows)
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Commit_Groups', index=False)
-            detailed_df.to_excel(writer, sheet_name='Detailed_Changes', index=False)
-            for sheet_name in writer.sheets:
+            rows.append({
+                'Group_ID': group['group_id'],
+                'Date_Time': group['start_str'],
+                'Author': group['author'],
+                'File_Count': group['file_count'],
+                'Duration_Minutes': (group['end_time'] - group['start_time']).total_seconds() / 60,
+                'Files': '; '.join(files),
+                'Common_Comment': group['common_comment'],
+                'All_Comments': group['all_comments']
+            })
+        return pd.DataFrame(rows), pd.DataFrame(detailed_rows)
+
+    def export_to_excel(self, groups, filename):
+        print(f"Exporting to Excel: {filename}")
+        df, detailed_df = self._build_frames(groups)
+        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
+            for sheet_name, frame in (('Commit_Groups', df), ('Detailed_Changes', detailed_df)):
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
                 worksheet = writer.sheets[sheet_name]
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+                for col_idx, column in enumerate(frame.columns):
+                    max_length = max(frame[column].astype(str).str.len().max(), len(str(column)))
+                    worksheet.set_column(col_idx, col_idx, min(max_length + 2, 50))
         print(f"Excel file created: {filename}")
         return filename
 
@@ -242,53 +338,41 @@ class CVSLogParser:
             "<button onclick='expandAll()'>Expand All</button>",
             "<button onclick='collapseAll()'>Collapse All</button>"
         ]
-        for idx, group in enumerate(groups, 1):
-            commit_time = group['start_time'].strftime('%Y-%m-%d %H:%M:%S')
-            author = group['author']
-            comments = [e['comment'] for e in group['entries'] if e['comment']]
-            main_comment = max(set(comments), key=comments.count) if comments else ""
-            header_text = f"[{commit_time}] {author} Comment: {main_comment}"
-            files_html = "<br>".join(
-                f"-- {entry['file']} (rev {entry['revision']})" for entry in group['entries']
-            )
-            html_parts.append("<div class='commit'>")
-            html_parts.append(f"<div class='header' onclick=\"toggle('files{idx}')\">{header_text}</div>")
-            html_parts.append(f"<div class='files' id='files{idx}'>{files_html}</div>")
-            html_parts.append("</div>")
-        html_parts.append("</body></html>")
-        html_content = "\n".join(html_parts)
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        webbrowser.open(f"file://{os.path.abspath(filename)}")
+        body_chunks = [self._html_commit_block(idx, group) for idx, group in enumerate(groups, 1)]
+        with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write("\n".join(html_parts))
+            f.write("\n")
+            f.write("\n".join(body_chunks))
+            f.write("\n</body></html>")
         print(f"HTML report created: {filename}")
         return filename
 
+    def _html_commit_block(self, idx, group):
+        header_text = f"[{group['start_str']}] {html.escape(group['author'])} Comment: {html.escape(group['common_comment'])}"
+        files_html = "<br>".join([
+            f"-- {html.escape(entry['file'])} (rev {entry['revision']})" for entry in group['entries']
+        ])
+        return (f"<div class='commit'><div class='header' onclick=\"toggle('files{idx}')\">{header_text}</div>"
+                f"<div class='files' id='files{idx}'>{files_html}</div></div>")
+
     def save_json_backup(self, groups, filename):
         print(f"Saving JSON backup: {filename}")
-        json_groups = []
-        for group in groups:
-            json_group = group.copy()
-            json_group['start_time'] = group['start_time'].isoformat()
-            json_group['end_time'] = group['end_time'].isoformat()
-            json_entries = []
-            for entry in group['entries']:
-                json_entry = entry.copy()
-                json_entry['date'] = entry['date'].isoformat()
-                json_entries.append(json_entry)
-            json_group['entries'] = json_entries
-            json_groups.append(json_group)
-        with open(filename, 'w') as f:
-            json.dump(json_groups, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(groups, default=_json_default, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(groups, f, indent=2, default=_json_default)
         print(f"JSON backup saved: {filename}")
 
     def analyze_repository(self, start_date=None, end_date=None, author=None, time_window=1, output_file=None):
         print("=== CVS Commit Analysis Started ===")
-        log_output = self.run_cvs_log(start_date, end_date, author)
-        if not log_output:
+        proc = self.run_cvs_log(start_date, end_date, author)
+        self.log_entries = self._read_cvs_log(proc) if proc else None
+        if self.log_entries is None:
             print("Failed to get CVS logs. Exiting.")
             return None
-        self.log_entries = self.parse_log_output(log_output)
-        if not self.log_entries:
+        if self.log_entries.empty:
             print("No log entries found. Exiting.")
             return None
         self.grouped_commits = self.group_commits(self.log_entries, time_window)
@@ -297,11 +381,17 @@ class CVSLogParser:
             output_file = out_dir / "cvs_commit_analysis.xlsx"
         else:
             output_file = out_dir / output_file
-        excel_file = self.export_to_excel(self.grouped_commits, output_file)
         json_file = out_dir / "cvs_analysis_backup.json"
-        self.save_json_backup(self.grouped_commits, json_file)
         html_file = out_dir / "cvs_commit_report.html"
-        self.export_to_html(self.grouped_commits, html_file)
+        # The three exports only read grouped_commits, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            excel_future = executor.submit(self.export_to_excel, self.grouped_commits, output_file)
+            json_future = executor.submit(self.save_json_backup, self.grouped_commits, json_file)
+            html_future = executor.submit(self.export_to_html, self.grouped_commits, html_file)
+            excel_file = excel_future.result()
+            json_future.result()
+            html_future.result()
+        webbrowser.open(f"file://{os.path.abspath(html_file)}")
         print("=== Analysis Complete ===")
         print(f"Total log entries: {len(self.log_entries)}")
         print(f"Commit groups created: {len(self.grouped_commits)}")